@@ -2,8 +2,9 @@
 """
 
 import math
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from enum import Enum
+from typing import Any
 
 
 class Operation(str, Enum):
@@ -14,34 +15,45 @@ class Operation(str, Enum):
     MANUAL_CREATION = ''
     SUM = '+'
     MUL = '*'
+    ADD_CONST = '+const'
+    MUL_CONST = '*const'
     TANH = 'tanh'
     RELU = 'relu'
     POWER = 'pow'
     ABS = 'abs'
+    LINEAR = 'linear'
+    SUM_N = 'sum'
+    MEAN = 'mean'
 
 
 class Parameter:
     """A parameter with automatic gradient tracking.
     """
 
+    __slots__ = ('value', '_prev', '_op', '_ctx', 'grad')
+
     def __init__(self, value: int | float,
                  _prev: tuple['Parameter', ...] | None = None,
-                 _op: str | Operation = Operation.MANUAL_CREATION) -> None:
+                 _op: str | Operation = Operation.MANUAL_CREATION,
+                 _ctx: Any = None) -> None:
         """Creates a new `Parameter` instance.
 
-        :param value: The value of the parameter.
+        :param value: The value of the parameter (stored as a `float`).
         will be extracted from it (ignoring user-provided args).
         :param _prev: The previous parameters that led to the creation
         of the parameter (if any), defaults to None
         :param _op: The operation that led to the creation of the
         parameter (if any), defaults to `Operation.MANUAL_CREATION`
+        :param _ctx: Any extra data required by the backward function of
+        the operation (e.g. the exponent of a power or the local derivative
+        of tanh), defaults to None
         """
-        self.value = value
-        self._prev = set(_prev if _prev is not None else tuple())
+        self.value = float(value)
+        self._prev = _prev if _prev is not None else ()
         self._op = _op
+        self._ctx = _ctx
 
         self.grad = 0.0
-        self._backward: Callable[[], None] = lambda: None
 
     def __repr__(self) -> str:
         """Provides a string representation of the parameter object.
@@ -56,18 +68,14 @@ class Parameter:
         :param param: The parameter to be added.
         :return: A new parameter with the value of the sum.
         """
+        if isinstance(param, (int, float)):
+            return Parameter(self.value + param, _prev=(self, ),
+                             _op=Operation.ADD_CONST, _ctx=param)
+
         input_param = (Parameter(param)
                        if not isinstance(param, Parameter) else param)
-        out_param = Parameter(self.value + input_param.value,
-                              _prev=(self, input_param), _op=Operation.SUM)
-
-        def _backward():
-            self.grad += out_param.grad
-            input_param.grad += out_param.grad
-
-        out_param._backward = _backward
-
-        return out_param
+        return Parameter(self.value + input_param.value,
+                         _prev=(self, input_param), _op=Operation.SUM)
 
     def __radd__(self, param: 'int | float | Parameter') -> 'Parameter':
         """Performs the addition of param + self.
@@ -107,17 +115,13 @@ class Parameter:
         :param param: The parameter to be multiplied with self.
         :return: A new parameter with the product result.
         """
-        param = Parameter(param) if not isinstance(param, Parameter) else param
-        out_param = Parameter(self.value * param.value,
-                              _prev=(self, param), _op=Operation.MUL)
-
-        def _backward():
-            self.grad += param.value * out_param.grad
-            param.grad += self.value * out_param.grad
+        if isinstance(param, (int, float)):
+            return Parameter(self.value * param, _prev=(self, ),
+                             _op=Operation.MUL_CONST, _ctx=param)
 
-        out_param._backward = _backward
-
-        return out_param
+        param = Parameter(param) if not isinstance(param, Parameter) else param
+        return Parameter(self.value * param.value,
+                         _prev=(self, param), _op=Operation.MUL)
 
     def __rmul__(self, other: 'int | float | Parameter') -> 'Parameter':
         """Implements the right-side parameter multiplication operation.
@@ -134,15 +138,8 @@ class Parameter:
         :return: A new parameter with grad tracking as obtained from the
         power operation.
         """
-        out_param = Parameter(self.value ** exp, _prev=(self, ),
-                              _op=(Operation.POWER))
-
-        def _backward() -> None:
-            self.grad += exp * (self.value ** (exp - 1)) * out_param.grad
-
-        out_param._backward = _backward
-
-        return out_param
+        return Parameter(self.value ** exp, _prev=(self, ),
+                         _op=Operation.POWER, _ctx=exp)
 
     def __truediv__(self, param: 'int | float | Parameter') -> 'Parameter':
         """Implements the division operation with automatic gradient
@@ -161,10 +158,7 @@ class Parameter:
         :return: A new parameter obtained from the division of a left operand
         with self (right-side operand).
         """
-        left_operand = (Parameter(param) if not isinstance(param, Parameter)
-                        else param)
-
-        return left_operand / self
+        return (self ** -1) * param
 
     def tanh(self) -> 'Parameter':
         """Applies the tanh operation on the given parameter, creating a new
@@ -172,16 +166,10 @@ class Parameter:
 
         :return: A parameter obtained after applying tanh to the object.
         """
-        exp_value = math.e ** (2 * self.value)
-        out_param = Parameter((exp_value - 1) / (exp_value + 1),
-                              _prev=(self, ), _op=Operation.TANH)
-
-        def _backward():
-            self.grad += (1.0 - out_param.value ** 2) * out_param.grad
-
-        out_param._backward = _backward
-
-        return out_param
+        value = math.tanh(self.value)
+        # The local derivative (1 - tanh^2) is stored for the backward pass
+        return Parameter(value, _prev=(self, ), _op=Operation.TANH,
+                         _ctx=1.0 - value * value)
 
     def relu(self) -> 'Parameter':
         """Applies the ReLU operation on the given parameter, creating a
@@ -190,31 +178,76 @@ class Parameter:
         :return: A new parameter with the value obtained after
         applying the ReLU operation.
         """
-        out_param = Parameter(0 if self.value < 0 else self.value,
-                              _prev=(self, ), _op=Operation.RELU)
+        return Parameter(0.0 if self.value < 0 else self.value,
+                         _prev=(self, ), _op=Operation.RELU)
 
-        def _backward() -> None:
-            self.grad += (out_param.value > 0) * out_param.grad
+    @staticmethod
+    def batch_relu(params: 'Iterable[Parameter]') -> 'list[Parameter]':
+        """Applies the ReLU operation on every given parameter in a single
+        pass, creating new ones as a result.
 
-        out_param._backward = _backward
-
-        return out_param
+        :param params: The parameters to which ReLU will be applied.
+        :return: A list of new parameters with the values obtained after
+        applying the ReLU operation.
+        """
+        return [Parameter(0.0 if param.value < 0 else param.value,
+                          _prev=(param, ), _op=Operation.RELU)
+                for param in params]
 
     def abs(self) -> 'Parameter':
         """Creates a new parameter with the absolute value of self.
 
         :return: A new param containing the absolute value of self.
         """
-        out_param = Parameter(abs(self.value), _prev=(self, ),
-                              _op=Operation.ABS)
-
-        def _backward() -> None:
-            sign = -1.0 if self.value < 0 else 1.0
-            self.grad += sign * out_param.grad
+        return Parameter(abs(self.value), _prev=(self, ), _op=Operation.ABS)
 
-        out_param._backward = _backward
+    @staticmethod
+    def sum(params: 'list[int | float | Parameter]') -> 'Parameter':
+        """Adds all the given parameters as a single node of the
+        computational graph (instead of a chain of binary sums).
 
-        return out_param
+        :param params: The parameters to be added.
+        :return: A new parameter with the value of the sum.
+        """
+        params = [param if isinstance(param, Parameter) else Parameter(param)
+                  for param in params]
+        return Parameter(sum(param.value for param in params),
+                         _prev=tuple(params), _op=Operation.SUM_N)
+
+    @staticmethod
+    def mean(params: 'list[int | float | Parameter]') -> 'Parameter':
+        """Averages all the given parameters as a single node of the
+        computational graph.
+
+        :param params: The parameters to be averaged.
+        :return: A new parameter with the value of the mean.
+        """
+        params = [param if isinstance(param, Parameter) else Parameter(param)
+                  for param in params]
+        return Parameter(sum(param.value for param in params) / len(params),
+                         _prev=tuple(params), _op=Operation.MEAN)
+
+    @staticmethod
+    def linear(inputs: 'list[Parameter]', weights: 'list[Parameter]',
+               bias: 'Parameter') -> 'Parameter':
+        """Computes the affine combination `sum(x * w) + b` as a single node
+        of the computational graph (instead of one node per product/sum).
+
+        :param inputs: The input parameters of the affine combination (raw
+        values must be wrapped into parameters by the caller).
+        :param weights: The weights to be multiplied with the inputs.
+        :param bias: The bias to be added to the weighted sum.
+        :return: A new parameter with the value of the affine combination.
+
+        NOTE: The weighted sum is computed in C by `math.sumprod`, so inputs
+        and weights must have the same length.
+        """
+        return Parameter(
+            math.sumprod([input_param.value for input_param in inputs],
+                         [weight.value for weight in weights]) + bias.value,
+            _prev=(*inputs, *weights, bias), _op=Operation.LINEAR,
+            _ctx=len(inputs)
+        )
 
     def backward(self) -> None:
         """Runs backpropagation, storing gradient values
@@ -222,23 +255,172 @@ class Parameter:
 
         NOTE: The backward propagation will be performed so that a
         node's backpropagation function gets called after the required
-        backpropagations already occurred.
+        backpropagations already occurred. The topological order is built
+        iteratively, so deep graphs do not hit Python's recursion limit.
         """
         self.grad = 1.0
 
-        topological_graph: list[Parameter] = []
-        visited: set[Parameter] = set()
+        # Insertion-ordered dict keyed by id: it is both the visited set and
+        # the topological order.
+        topological_graph: dict[int, Parameter] = {}
+        stack: list[tuple[Parameter, bool]] = [(self, False)]
+
+        while stack:
+            param, expanded = stack.pop()
+            if expanded:
+                topological_graph[id(param)] = param
+            elif id(param) not in topological_graph:
+                stack.append((param, True))
+                stack.extend((prev_param, False) for prev_param in param._prev)
+
+        for param in reversed(topological_graph.values()):
+            _BACKWARDS.get(param._op, _backward_noop)(param)
+
+
+# The backward functions below read the graph bookkeeping of the nodes
+# pylint: disable=protected-access
+
+
+def _backward_noop(_: Parameter) -> None:
+    """Backward function of the parameters that were not created from an
+    operation (nothing to propagate).
+    """
+
+
+def _backward_sum(out_param: Parameter) -> None:
+    """Backward function of the sum operation.
+
+    :param out_param: The parameter obtained from the operation.
+    """
+    left_param, right_param = out_param._prev
+    left_param.grad += out_param.grad
+    right_param.grad += out_param.grad
+
 
-        def build_topological_graph(param: Parameter):
-            if param in visited:
-                return
+def _backward_mul(out_param: Parameter) -> None:
+    """Backward function of the product operation.
 
-            visited.add(param)
-            for prev_param in param._prev:
-                build_topological_graph(prev_param)
+    :param out_param: The parameter obtained from the operation.
+    """
+    left_param, right_param = out_param._prev
+    left_param.grad += right_param.value * out_param.grad
+    right_param.grad += left_param.value * out_param.grad
+
+
+def _backward_add_const(out_param: Parameter) -> None:
+    """Backward function of the sum with a constant operation.
+
+    :param out_param: The parameter obtained from the operation.
+    """
+    param, = out_param._prev
+    param.grad += out_param.grad
+
+
+def _backward_mul_const(out_param: Parameter) -> None:
+    """Backward function of the product with a constant operation.
+
+    :param out_param: The parameter obtained from the operation.
+    """
+    param, = out_param._prev
+    param.grad += out_param._ctx * out_param.grad
+
+
+def _backward_power(out_param: Parameter) -> None:
+    """Backward function of the power operation.
+
+    :param out_param: The parameter obtained from the operation.
+    """
+    param, = out_param._prev
+    exp = out_param._ctx
+    # Common exponents avoid the generic (slower) float power
+    if exp == 2:
+        local_grad = 2.0 * param.value
+    elif exp == -1:
+        local_grad = -out_param.value * out_param.value
+    elif exp == 1:
+        local_grad = 1.0
+    else:
+        local_grad = exp * (param.value ** (exp - 1))
+
+    param.grad += local_grad * out_param.grad
+
+
+def _backward_tanh(out_param: Parameter) -> None:
+    """Backward function of the tanh operation.
+
+    :param out_param: The parameter obtained from the operation.
+    """
+    param, = out_param._prev
+    param.grad += out_param._ctx * out_param.grad
 
-            topological_graph.append(param)
 
-        build_topological_graph(self)
-        for param in reversed(topological_graph):
-            param._backward()
+def _backward_relu(out_param: Parameter) -> None:
+    """Backward function of the ReLU operation.
+
+    :param out_param: The parameter obtained from the operation.
+    """
+    if out_param.value > 0:
+        param, = out_param._prev
+        param.grad += out_param.grad
+
+
+def _backward_abs(out_param: Parameter) -> None:
+    """Backward function of the absolute value operation.
+
+    :param out_param: The parameter obtained from the operation.
+    """
+    param, = out_param._prev
+    sign = -1.0 if param.value < 0 else 1.0
+    param.grad += sign * out_param.grad
+
+
+def _backward_sum_n(out_param: Parameter) -> None:
+    """Backward function of the N-ary sum operation.
+
+    :param out_param: The parameter obtained from the operation.
+    """
+    for param in out_param._prev:
+        param.grad += out_param.grad
+
+
+def _backward_mean(out_param: Parameter) -> None:
+    """Backward function of the mean operation.
+
+    :param out_param: The parameter obtained from the operation.
+    """
+    grad = out_param.grad / len(out_param._prev)
+    for param in out_param._prev:
+        param.grad += grad
+
+
+def _backward_linear(out_param: Parameter) -> None:
+    """Backward function of the linear (affine) operation.
+
+    :param out_param: The parameter obtained from the operation.
+    """
+    n_inputs = out_param._ctx
+    inputs = out_param._prev[:n_inputs]
+    weights = out_param._prev[n_inputs:-1]
+    bias = out_param._prev[-1]
+    for input_param, weight in zip(inputs, weights):
+        input_param.grad += weight.value * out_param.grad
+        weight.grad += input_param.value * out_param.grad
+    bias.grad += out_param.grad
+
+
+_BACKWARDS: dict[str, Callable[[Parameter], None]] = {
+    Operation.MANUAL_CREATION: _backward_noop,
+    Operation.SUM: _backward_sum,
+    Operation.MUL: _backward_mul,
+    Operation.ADD_CONST: _backward_add_const,
+    Operation.MUL_CONST: _backward_mul_const,
+    Operation.POWER: _backward_power,
+    Operation.TANH: _backward_tanh,
+    Operation.RELU: _backward_relu,
+    Operation.ABS: _backward_abs,
+    Operation.SUM_N: _backward_sum_n,
+    Operation.MEAN: _backward_mean,
+    Operation.LINEAR: _backward_linear,
+}
+
+# pylint: enable=protected-access
@@ -1,7 +1,7 @@
 """Implements activation functions to be used for nnet definition.
 """
 
-from gradlite.nn.activations.identity import Identity
+from gradlite.nn.activations.identity import Identity, identity
 from gradlite.nn.activations.relu import ReLU
 
-__all__ = ['Identity', 'ReLU']
+__all__ = ['Identity', 'ReLU', 'identity']
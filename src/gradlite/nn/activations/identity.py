@@ -18,3 +18,15 @@ class Identity(Module):
         :return: The given input
         """
         return value
+
+
+_IDENTITY = Identity()
+
+
+def identity() -> Identity:
+    """Retrieves the shared identity activation function (it is stateless,
+    so a single instance can be reused by every layer).
+
+    :return: The shared `Identity` instance.
+    """
+    return _IDENTITY
@@ -1,6 +1,8 @@
 """Implements the ReLU activation function as a gradlite.nn.Module.
 """
 
+from collections.abc import Iterable
+
 from gradlite.core import Parameter
 from gradlite.nn.module import Module
 
@@ -10,16 +12,15 @@ class ReLU(Module):
     """
 
     def forward(
-        self, value: Parameter | list[Parameter]
+        self, value: Parameter | Iterable[Parameter]
     ) -> Parameter | list[Parameter]:
         """Runs the ReLU forward pass.
 
-        :param value: A tensor of parameters or a parameter.
+        :param value: A tensor of parameters (any iterable, e.g. a list,
+        a tuple or a generator) or a parameter.
         :return: A tensor of parameters or a parameter with ReLU applied
         """
         if isinstance(value, Parameter):
             return value.relu()
 
-        return [param.relu() for param in value]
-        return [param.relu() for param in value]
-        return [param.relu() for param in value]
+        return Parameter.batch_relu(value)
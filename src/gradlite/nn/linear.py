@@ -4,7 +4,7 @@
 from random import uniform
 
 from gradlite.core.parameter import Parameter
-from gradlite.nn.activations import Identity
+from gradlite.nn.activations import identity
 from gradlite.nn.module import Module
 
 
@@ -27,17 +27,27 @@ class Neuron(Module):
         self.bias = Parameter(0.0)
 
         activation_fn = (activation_fn if activation_fn is not None
-                         else Identity())
+                         else identity())
         self.activation_fn = activation_fn
 
-    def forward(self, tensor: list[Parameter]) -> Parameter:
+    def forward(self, tensor: list[int | float | Parameter]) -> Parameter:
         """Runs the forward method of a basic neuron.
 
         :param tensor: The input tensor of the neuron.
         :returns: The output tensor of the neuron.
         """
-        out_value = sum([input_val * weight + self.bias
-                         for input_val, weight in zip(tensor, self.weights)])
+        tensor = [input_val if isinstance(input_val, Parameter)
+                  else Parameter(input_val) for input_val in tensor]
+        return self.forward_parameters(tensor)
+
+    def forward_parameters(self, tensor: list[Parameter]) -> Parameter:
+        """Runs the forward method of a basic neuron on an input tensor
+        whose values are already parameters (no wrapping is performed).
+
+        :param tensor: The input tensor of the neuron.
+        :returns: The output tensor of the neuron.
+        """
+        out_value = Parameter.linear(tensor, self.weights, self.bias)
         out_value = self.activation_fn(out_value)
         return out_value
 
@@ -58,15 +68,20 @@ class Linear(Module):
         super().__init__()
 
         activation_fn = (activation_fn if activation_fn is not None
-                         else Identity())
+                         else identity())
 
         self.neurons = [Neuron(input_features, activation_fn=activation_fn)
                         for _ in range(output_features)]
 
-    def forward(self, tensor: list[Parameter]) -> list[Parameter]:
+    def forward(
+        self, tensor: list[int | float | Parameter]
+    ) -> list[Parameter]:
         """Runs the forward method of the linear layer-
 
         :param tensor: The input tensor of the linear layer.
         :return: The output obtained after the linear layer.
         """
-        return [neuron(tensor) for neuron in self.neurons]
+        tensor = [input_val if isinstance(input_val, Parameter)
+                  else Parameter(input_val) for input_val in tensor]
+        # Inputs are wrapped once here, not once per neuron
+        return [neuron.forward_parameters(tensor) for neuron in self.neurons]
@@ -26,9 +26,9 @@ class MAE(Module):
                   for pred_param, true_param in zip(y_pred, y_true)]
 
         if self.agg_fn == 'sum':
-            loss = sum(losses)
+            loss = Parameter.sum(losses)
         elif self.agg_fn == 'mean':
-            loss = sum(losses) / len(y_pred)
+            loss = Parameter.mean(losses)
         else:
             raise ValueError(f"Unknown agg function '{self.agg_fn}'")
 
@@ -28,13 +28,14 @@ class MSE(Module):
         :param y_true: The ground truth values for N inputs.
         :return: The MSE loss function.
         """
-        losses = [(pred_val - true_val) ** 2
-                  for pred_val, true_val in zip(y_pred, y_true)]
+        differences = [pred_val - true_val
+                       for pred_val, true_val in zip(y_pred, y_true)]
+        losses = [difference * difference for difference in differences]
 
         if self.agg_fn == 'sum':
-            loss = sum(losses)
+            loss = Parameter.sum(losses)
         elif self.agg_fn == 'mean':
-            loss = sum(losses) / len(y_pred)
+            loss = Parameter.mean(losses)
         else:
             raise ValueError(f"Unknown agg function '{self.agg_fn}'")
 
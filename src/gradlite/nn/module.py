@@ -2,32 +2,70 @@
 """
 
 from abc import ABC, abstractmethod
+from itertools import chain
 from typing import Any
 
 from gradlite.core import Parameter
 
+# Attribute types that can never hold parameters nor submodules
+_PLAIN_TYPES = frozenset({int, float, str, bool, tuple, dict, type(None)})
+
 
 class Module(ABC):
     """Defines a nnet in gradlite.
     """
 
+    __slots__ = ('_parameters', '_modules', '_params_cache',
+                 '_params_cache_version')
+
+    _parameters: dict[str, tuple[Parameter, ...]]
+    _modules: dict[str, tuple['Module', ...]]
+    _params_cache: tuple[Parameter, ...] | None
+    _params_cache_version: int
+
+    # Bookkeeping slots bypass registration (copy/pickle restore them
+    # through `__setattr__` before the registries exist)
+    _SLOT_NAMES = frozenset(__slots__)
+
+    # Incremented whenever any module (un)registers a parameter or a
+    # submodule, so that cached `parameters()` of ancestors get refreshed
+    _structure_version = 0
+
     def __init__(self) -> None:
         """Creates a gradlite neural network instance.
         """
-        self._params: dict[str, frozenset[Parameter]] = {}
+        self._parameters = {}
+        self._modules = {}
+        self._params_cache = None
+        self._params_cache_version = -1
 
-    def parameters(self) -> frozenset[Parameter]:
+    def parameters(self) -> tuple[Parameter, ...]:
         """Retrieves the parameters of the defined neural network.
+
+        NOTE: The parameters of submodules are collected recursively. The
+        result is cached until a parameter or a submodule is (un)registered
+        in any module.
         """
-        return frozenset([param
-                         for module_params in self._params.values()
-                         for param in module_params])
+        if (self._params_cache is None
+                or self._params_cache_version != Module._structure_version):
+            # dict.fromkeys removes duplicates while keeping the order
+            params = dict.fromkeys(
+                chain.from_iterable(self._parameters.values())
+            )
+            for module in chain.from_iterable(self._modules.values()):
+                params.update(dict.fromkeys(module.parameters()))
+
+            object.__setattr__(self, '_params_cache', tuple(params))
+            object.__setattr__(self, '_params_cache_version',
+                               Module._structure_version)
+
+        return self._params_cache
 
     def zero_grad(self) -> None:
         """Zeroes-out the gradients of all the module's params.
         """
         for param in self.parameters():
-            param.grad = 0
+            param.grad = 0.0
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Sets a given value as an attribute of the module.
@@ -35,34 +73,68 @@ class Module(ABC):
         :param name: The name of the attribute.
         :param value: The value of the attribute.
         """
+        if name in Module._SLOT_NAMES:
+            super().__setattr__(name, value)
+            return
+
+        # Reassigned attributes must not keep their old parameters/submodules
+        self._unregister(name)
+
+        if type(value) in _PLAIN_TYPES:
+            super().__setattr__(name, value)
+            return
+
         if isinstance(value, Module):
-            self._params[name] = value.parameters()
+            self._modules[name] = (value, )
+            Module._structure_version += 1
         elif isinstance(value, list):
             list_params: list[Parameter] = []
+            list_modules: list[Module] = []
             for item in value:
-                if isinstance(item, Parameter):
+                # Exact type check first: lists of parameters are the norm,
+                # subclasses are still caught by the isinstance branch below
+                # pylint: disable-next=unidiomatic-typecheck
+                if type(item) is Parameter:
                     list_params.append(item)
                 elif isinstance(item, Module):
-                    list_params.extend(list(item.parameters()))
+                    list_modules.append(item)
+                elif isinstance(item, Parameter):
+                    list_params.append(item)
 
             if len(list_params) > 0:
-                self._params[name] = frozenset(list_params)
+                self._parameters[name] = tuple(list_params)
+                Module._structure_version += 1
+            if len(list_modules) > 0:
+                self._modules[name] = tuple(list_modules)
+                Module._structure_version += 1
         elif isinstance(value, Parameter):
-            self._params[name] = frozenset([value])
+            self._parameters[name] = (value, )
+            Module._structure_version += 1
 
         super().__setattr__(name, value)
 
     def __delattr__(self, name: str) -> None:
         """Removes a given attribute from the module, and its parameters
-        if any.
+        and submodules if any.
 
         :param name: The name of the attribute to be removed.
         """
-        if name in self._params:
-            del self._params[name]
-
+        self._unregister(name)
         super().__delattr__(name)
 
+    def _unregister(self, name: str) -> None:
+        """Removes the parameters and submodules registered under a given
+        attribute name, if any.
+
+        :param name: The name of the attribute.
+        """
+        if name in self._parameters:
+            del self._parameters[name]
+            Module._structure_version += 1
+        if name in self._modules:
+            del self._modules[name]
+            Module._structure_version += 1
+
     @abstractmethod
     def forward(self, *args: Any, **kwds: Any) -> Any:
         """Runs the forward pass of the nnet.
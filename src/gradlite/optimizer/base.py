@@ -14,17 +14,18 @@ class Optimizer(ABC):
     def __init__(self, params: Iterable[Parameter], lr: float = 1e-4) -> None:
         """Creates a new optimizer.
 
-        :param params: The parameters to be optimized.
+        :param params: The parameters to be optimized (collected once into
+        a tuple, so one-shot iterables such as generators also work).
         :param lr: The learning rate, defaults to 1e-4
         """
-        self.params = params
+        self.params = tuple(params)
         self.lr = lr
 
     def zero_grad(self) -> None:
         """Zero's out the gradients of the parameters.
         """
         for param in self.params:
-            param.grad = 0
+            param.grad = 0.0
 
     @abstractmethod
     def step(self) -> None:
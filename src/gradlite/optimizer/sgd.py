@@ -1,6 +1,9 @@
 """Implements default SGD optimizer in gradlite.
 """
 
+from collections.abc import Iterable
+
+from gradlite.core.parameter import Parameter
 from gradlite.optimizer.base import Optimizer
 
 
@@ -8,6 +11,35 @@ class SGD(Optimizer):
     """Implements the SGD optimizer in gradlite.
     """
 
+    def __init__(self, params: Iterable[Parameter], lr: float = 1e-4,
+                 momentum: float = 0.0, weight_decay: float = 0.0) -> None:
+        """Creates a new SGD optimizer.
+
+        :param params: The parameters to be optimized.
+        :param lr: The learning rate, defaults to 1e-4
+        :param momentum: The momentum factor, defaults to 0.0
+        :param weight_decay: The L2 penalty factor, defaults to 0.0
+        """
+        super().__init__(params, lr=lr)
+        self.momentum = momentum
+        self.weight_decay = weight_decay
+        self._velocities = [0.0] * len(self.params)
+
     def step(self) -> None:
-        for param in self.params:
-            param.value -= self.lr * param.grad
+        lr = self.lr
+        if self.momentum == 0.0 and self.weight_decay == 0.0:
+            for param in self.params:
+                param.value -= lr * param.grad
+            return
+
+        # Weight decay, momentum and the update are fused in a single pass,
+        # so each value, gradient and velocity is read and written once
+        momentum = self.momentum
+        weight_decay = self.weight_decay
+        velocities = self._velocities
+        for idx, param in enumerate(self.params):
+            value = param.value
+            velocity = (momentum * velocities[idx]
+                        + param.grad + weight_decay * value)
+            velocities[idx] = velocity
+            param.value = value - lr * velocity
@@ -2,11 +2,23 @@
 backpropagation gradient flow visualizations.
 """
 
-try:
-    import graphviz
-    del graphviz
-except ImportError:
-    raise ImportError(
-        "gradlite's viz module requires Graphviz. "
-        "Please install system Graphviz and pip install grad[viz]"
-    )
+from functools import cache
+from types import ModuleType
+
+
+@cache
+def _ensure_graphviz() -> ModuleType:
+    """Imports Graphviz the first time a visualization needs it, so that
+    importing `gradlite.viz` does not pay the Graphviz import cost.
+
+    :return: The `graphviz` module.
+    """
+    try:
+        import graphviz  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError(
+            "gradlite's viz module requires Graphviz. "
+            "Please install system Graphviz and pip install grad[viz]"
+        ) from exc
+
+    return graphviz